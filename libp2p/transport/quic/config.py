@@ -43,6 +43,7 @@ class QUICTransportKwargs(TypedDict, total=False):
     max_concurrent_streams: int
     connection_window: int
     stream_window: int
+    congestion_control_algorithm: str
 
     # Logging and debugging
     enable_qlog: bool
@@ -82,6 +83,8 @@ class QUICTransportConfig(ConnectionConfig):
     max_concurrent_streams: int = 100  # Maximum concurrent streams per connection
     connection_window: int = 1024 * 1024  # Connection flow control window
     stream_window: int = 64 * 1024  # Stream flow control window
+    # aioquic congestion controller: "reno" (aioquic default) or "cubic"
+    congestion_control_algorithm: str = "reno"
 
     # Logging and debugging
     enable_qlog: bool = False  # Enable QUIC logging
@@ -233,6 +236,12 @@ class QUICTransportConfig(ConnectionConfig):
         if self.max_datagram_size < 1200:
             raise ValueError("Max datagram size must be at least 1200 bytes")
 
+        if self.congestion_control_algorithm not in ("reno", "cubic"):
+            raise ValueError(
+                "congestion_control_algorithm must be 'reno' or 'cubic', "
+                f"got {self.congestion_control_algorithm!r}"
+            )
+
         # Validate timeouts
         timeout_fields = [
             "STREAM_OPEN_TIMEOUT",
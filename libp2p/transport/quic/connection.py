@@ -5,8 +5,11 @@ Manages bidirectional QUIC connections with integrated stream multiplexing.
 
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
+import errno
 import logging
 import socket
+import struct
+import sys
 import time
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -43,6 +46,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# UDP generic segmentation offload (Linux >= 4.18): a single sendmsg() carries
+# several equally sized datagrams which the kernel splits on the way out
+_UDP_SEGMENT: int | None = (
+    getattr(socket, "UDP_SEGMENT", 103) if sys.platform == "linux" else None
+)
+# Kernel limits for one GSO send (UDP_MAX_SEGMENTS, max UDP payload)
+_GSO_MAX_SEGMENTS = 64
+_GSO_MAX_BYTES = 65000
+# sendmsg() errors meaning the kernel or device cannot do GSO at all; any
+# other error is treated as transient and GSO stays enabled
+_GSO_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EIO, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOPROTOOPT}
+)
+
 
 class QUICConnection(IRawConnection, IMuxedConn):
     """
@@ -122,11 +139,11 @@ class QUICConnection(IRawConnection, IMuxedConn):
         # Trio networking - socket may be provided by listener
         self._socket = listener_socket if listener_socket else None
         self._owns_socket = listener_socket is None
+        self._gso_enabled = _UDP_SEGMENT is not None
         self._connected_event = trio.Event()
         self._closed_event = trio.Event()
 
         self._streams: dict[int, QUICStream] = {}
-        self._stream_cache: dict[int, QUICStream] = {}  # Cache for frequent lookups
         self._next_stream_id: int = self._calculate_initial_stream_id()
         self._stream_handler: TQUICStreamHandlerFn | None = None
 
@@ -136,6 +153,12 @@ class QUICConnection(IRawConnection, IMuxedConn):
         # Stream counting and limits
         self._outbound_stream_count: int = 0
         self._inbound_stream_count: int = 0
+        # Highest peer-initiated stream ID seen per stream type (the low two
+        # bits of the ID), plus lower IDs of that type not yet seen. Together
+        # they recognise late FINs for inbound streams already closed and
+        # removed, without mistaking a new FIN-only stream for one.
+        self._highest_inbound_stream_ids: dict[int, int] = {}
+        self._unseen_inbound_stream_ids: set[int] = set()
 
         # Stream acceptance for incoming streams
         self._stream_accept_queue: list[QUICStream] = []
@@ -189,11 +212,21 @@ class QUICConnection(IRawConnection, IMuxedConn):
         # Starts at 0 for initial CID, increments for each new CID issued
         self._connection_id_sequence_counter: int = 0
 
+        # Wakes the event processing loop when there is work for it: a datagram
+        # was fed to the QUIC state machine, a stream queued data (so concurrent
+        # writes are flushed by a single _transmit()), or the connection closed
+        self._wakeup_event = trio.Event()
+
         # Event processing control with batching
         self._event_processing_active: bool = False
         self._event_batch: list[events.QuicEvent] = []
         self._event_batch_size: int = 10
-        self._last_event_time: float = 0.0
+        # Upper bound on how long the event loop blocks when aioquic has no timer
+        self.MAX_IDLE_WAIT_SECONDS = 1.0
+        # Housekeeping (idle stream cleanup, stats) runs from the event loop
+        # at this interval rather than in a task of its own
+        self.MAINTENANCE_INTERVAL_SECONDS = 30.0
+        self._next_maintenance_time = 0.0
 
         # Set quic connection configuration
         self.CONNECTION_CLOSE_TIMEOUT = self._transport._config.CONNECTION_CLOSE_TIMEOUT
@@ -224,10 +257,29 @@ class QUICConnection(IRawConnection, IMuxedConn):
             "connection_id_changes": 0,
         }
 
+        # QUIC event type -> handler, so dispatch is one dict lookup per event
+        self._event_handlers: dict[
+            type[QuicEvent], Callable[[Any], Awaitable[None]]
+        ] = {
+            events.ConnectionTerminated: self._handle_connection_terminated,
+            events.HandshakeCompleted: self._handle_handshake_completed,
+            events.StreamDataReceived: self._handle_stream_data,
+            events.StreamReset: self._handle_stream_reset,
+            events.DatagramFrameReceived: self._handle_datagram_received,
+            # Connection ID events - critical for proper packet routing
+            events.ConnectionIdIssued: self._handle_connection_id_issued,
+            events.ConnectionIdRetired: self._handle_connection_id_retired,
+            events.PingAcknowledged: self._handle_ping_acknowledged,
+            events.ProtocolNegotiated: self._handle_protocol_negotiated,
+            events.StopSendingReceived: self._handle_stop_sending_received,
+        }
+
         logger.debug(
-            f"Created QUIC connection to {self._remote_peer_id} "
-            f"(initiator: {self._is_initiator}, addr: {self._remote_addr}, "
-            f"security: {self._security_manager is not None})"
+            "Created QUIC connection to %s (initiator: %s, addr: %s, security: %s)",
+            self._remote_peer_id,
+            self._is_initiator,
+            self._remote_addr,
+            self._security_manager is not None,
         )
 
     def set_listener_context(
@@ -320,21 +372,6 @@ class QUICConnection(IRawConnection, IMuxedConn):
         """Get the current connection ID."""
         return self._current_connection_id
 
-    # Fast stream lookup with caching
-    def _get_stream_fast(self, stream_id: int) -> QUICStream | None:
-        """Get stream with caching for performance."""
-        # Try cache first
-        stream = self._stream_cache.get(stream_id)
-        if stream is not None:
-            return stream
-
-        # Fallback to main dict
-        stream = self._streams.get(stream_id)
-        if stream is not None:
-            self._stream_cache[stream_id] = stream
-
-        return stream
-
     # Connection lifecycle methods
 
     async def start(self) -> None:
@@ -352,7 +389,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
             raise QUICConnectionError("Cannot start a closed connection")
 
         self._started = True
-        logger.debug(f"Starting QUIC connection to {self._remote_peer_id}")
+        logger.debug("Starting QUIC connection to %s", self._remote_peer_id)
 
         try:
             # If this is a client connection, we need to establish the connection
@@ -366,7 +403,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 # Set event_started after connection is established for server
                 self.event_started.set()
 
-            logger.debug(f"QUIC connection to {self._remote_peer_id} started")
+            logger.debug("QUIC connection to %s started", self._remote_peer_id)
 
         except Exception as e:
             logger.error(f"Failed to start connection: {e}")
@@ -441,7 +478,9 @@ class QUICConnection(IRawConnection, IMuxedConn):
 
                 logger.debug(f"QUICConnection {id(self)}: Peer identity verified")
                 self._established = True
-                logger.debug(f"QUIC connection established with {self._remote_peer_id}")
+                logger.debug(
+                    "QUIC connection established with %s", self._remote_peer_id
+                )
 
                 # Set event_started after connection is fully established for initiator
                 if self._is_initiator:
@@ -463,7 +502,6 @@ class QUICConnection(IRawConnection, IMuxedConn):
             self._nursery.start_soon(async_fn=self._client_packet_receiver)
 
         self._nursery.start_soon(async_fn=self._event_processing_loop)
-        self._nursery.start_soon(async_fn=self._periodic_maintenance)
 
         logger.debug("Started background tasks for QUIC connection")
 
@@ -475,31 +513,30 @@ class QUICConnection(IRawConnection, IMuxedConn):
         )
 
         try:
-            consecutive_idle_iterations = 0
             while not self._closed:
-                # Batch process events - returns True if events were processed
-                events_processed = await self._process_quic_events_batched()
-
-                # Handle timer events
+                # Re-arm the wakeup event before doing work, so anything queued
+                # while this pass runs triggers another pass right away
+                if self._wakeup_event.is_set():
+                    self._wakeup_event = trio.Event()
+
+                # Handle timer events first: handle_timer() may queue events
+                # (e.g. ConnectionTerminated on idle timeout) and clear the
+                # timer, so they must be drained in this same pass
                 await self._handle_timer_events()
 
+                # Drain all pending QUIC events
+                await self._process_quic_events_batched()
+
                 # Transmit any pending data
                 await self._transmit()
 
-                # Adaptive sleep based on activity
-                # When processing events: use minimal sleep (just yield) for low latency
-                # When idle: use longer sleep to reduce CPU usage
-                if not events_processed:
-                    consecutive_idle_iterations += 1
-                    # Use longer sleep when idle to reduce CPU usage
-                    # Start with 1ms, increase to 10ms after several idle iterations
-                    sleep_time = 0.01 if consecutive_idle_iterations > 5 else 0.001
-                    await trio.sleep(sleep_time)
-                else:
-                    consecutive_idle_iterations = 0
-                    # Minimal sleep when processing events - just yield to allow
-                    # other tasks to run, but keep latency low
-                    await trio.sleep(0)  # Yield without sleeping
+                if time.monotonic() >= self._next_maintenance_time:
+                    await self._periodic_maintenance()
+
+                # Block until woken by new work or until aioquic's next timer
+                # (loss detection, ACK delay, idle timeout) is due
+                with trio.move_on_after(self._next_wakeup_timeout()):
+                    await self._wakeup_event.wait()
 
         except Exception as e:
             logger.error(f"Error in event processing loop: {e}")
@@ -507,39 +544,42 @@ class QUICConnection(IRawConnection, IMuxedConn):
         finally:
             logger.debug("QUIC event processing loop finished")
 
-    async def _periodic_maintenance(self) -> None:
-        """Perform periodic connection maintenance."""
-        try:
-            while not self._closed:
-                # Update connection statistics
-                self._update_stats()
+    def _wake_event_loop(self) -> None:
+        """Wake the event processing loop to handle newly available work."""
+        self._wakeup_event.set()
 
-                # Check for idle streams that can be cleaned up
-                await self._cleanup_idle_streams()
+    def _next_wakeup_timeout(self) -> float:
+        """Seconds until the event loop must run again for aioquic's timer."""
+        timer = self._quic.get_timer()
+        if timer is None:
+            return self.MAX_IDLE_WAIT_SECONDS
+        return min(max(timer - time.time(), 0.0), self.MAX_IDLE_WAIT_SECONDS)
 
-                if logger.isEnabledFor(logging.DEBUG):
-                    cid_stats = self.get_connection_id_stats()
-                    logger.debug(f"Connection ID stats: {cid_stats}")
+    async def _periodic_maintenance(self) -> None:
+        """
+        Perform periodic connection maintenance.
+
+        Called from the event processing loop once per maintenance interval,
+        so each connection costs the shared nursery one less long-lived task
+        and nothing lingers in a 30s sleep after the connection closes.
+        """
+        self._next_maintenance_time = (
+            time.monotonic() + self.MAINTENANCE_INTERVAL_SECONDS
+        )
+        try:
+            # Update connection statistics
+            self._update_stats()
 
-                # Clean cache periodically
-                await self._cleanup_cache()
+            # Check for idle streams that can be cleaned up
+            await self._cleanup_idle_streams()
 
-                # Sleep for maintenance interval
-                await trio.sleep(30.0)  # 30 seconds
+            if logger.isEnabledFor(logging.DEBUG):
+                cid_stats = self.get_connection_id_stats()
+                logger.debug(f"Connection ID stats: {cid_stats}")
 
         except Exception as e:
             logger.error(f"Error in periodic maintenance: {e}")
 
-    async def _cleanup_cache(self) -> None:
-        """Clean up stream cache periodically to prevent memory leaks."""
-        if len(self._stream_cache) > 100:  # Arbitrary threshold
-            # Remove closed streams from cache
-            closed_stream_ids = [
-                sid for sid, stream in self._stream_cache.items() if stream.is_closed()
-            ]
-            for sid in closed_stream_ids:
-                self._stream_cache.pop(sid, None)
-
     async def _client_packet_receiver(self) -> None:
         """Receive packets for client connections."""
         logger.debug("Starting client packet receiver")
@@ -550,7 +590,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 try:
                     # Receive UDP packets
                     data, addr = await self._socket.recvfrom(65536)
-                    logger.debug(f"Client received {len(data)} bytes from {addr}")
+                    logger.debug("Client received %d bytes from %s", len(data), addr)
 
                     # Feed packet to QUIC connection
                     self._quic.receive_datagram(data, addr, now=time.time())
@@ -561,6 +601,10 @@ class QUICConnection(IRawConnection, IMuxedConn):
                     # Send any response packets
                     await self._transmit()
 
+                    # The datagram may have queued events or moved aioquic's
+                    # timer; let the event loop recompute its deadline
+                    self._wake_event_loop()
+
                 except trio.ClosedResourceError:
                     logger.debug("Client socket closed")
                     break
@@ -819,8 +863,8 @@ class QUICConnection(IRawConnection, IMuxedConn):
                             )
                         )
                     except Exception as e:
-                        logger.warning(f"Failed to acquire stream scope: {e}")
-                        raise QUICStreamLimitError(f"Resource limit exceeded: {e}")
+                        logger.warning("Failed to acquire stream scope: %s", e)
+                        raise QUICStreamLimitError("Resource limit exceeded") from e
 
                 stream = QUICStream(
                     connection=self,
@@ -831,12 +875,11 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 )
 
                 self._streams[stream_id] = stream
-                self._stream_cache[stream_id] = stream  # Add to cache
 
                 self._outbound_stream_count += 1
                 self._stats["streams_opened"] += 1
 
-                logger.debug(f"Opened outbound QUIC stream {stream_id}")
+                logger.debug("Opened outbound QUIC stream %d", stream_id)
                 return stream
 
         raise QUICStreamTimeoutError(f"Stream creation timed out after {timeout}s")
@@ -875,7 +918,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
             async with self._stream_lock:
                 if self._stream_accept_queue:
                     stream = self._stream_accept_queue.pop(0)
-                    logger.debug(f"Accepted inbound stream {stream.stream_id}")
+                    logger.debug("Accepted inbound stream %s", stream.stream_id)
                     return stream
 
                 # If the event is already set but the queue is empty, reset it to avoid
@@ -912,32 +955,22 @@ class QUICConnection(IRawConnection, IMuxedConn):
         """
         if stream_id in self._streams:
             stream = self._streams.pop(stream_id)
-            # Remove from cache too
-            self._stream_cache.pop(stream_id, None)
-
-            # Update stream counts asynchronously
-            async def update_counts() -> None:
-                async with self._stream_lock:
-                    if stream.direction == StreamDirection.OUTBOUND:
-                        self._outbound_stream_count = max(
-                            0, self._outbound_stream_count - 1
-                        )
-                    else:
-                        self._inbound_stream_count = max(
-                            0, self._inbound_stream_count - 1
-                        )
-                    self._stats["streams_closed"] += 1
 
-            # Schedule count update if we're in a trio context
-            if self._nursery:
-                self._nursery.start_soon(update_counts)
+            # Update stream counts inline: there is no checkpoint between the
+            # read and the write, so this cannot race open_stream() under trio
+            # and needs neither the stream lock nor a task per closed stream
+            if stream.direction == StreamDirection.OUTBOUND:
+                self._outbound_stream_count = max(0, self._outbound_stream_count - 1)
+            else:
+                self._inbound_stream_count = max(0, self._inbound_stream_count - 1)
+            self._stats["streams_closed"] += 1
 
-            logger.debug(f"Removed stream {stream_id} from connection")
+            logger.debug("Removed stream %d from connection", stream_id)
 
     # Batched event processing to reduce overhead
     async def _process_quic_events_batched(self) -> bool:
         """
-        Process QUIC events in batches for better performance.
+        Drain all pending QUIC events, processing them in batches.
 
         Returns:
             True if events were processed, False if no events available
@@ -947,29 +980,22 @@ class QUICConnection(IRawConnection, IMuxedConn):
             return False  # Prevent recursion
 
         self._event_processing_active = True
-        result = False  # Default to False if no events processed
+        result = False
 
         try:
-            current_time = time.time()
-            events_processed = 0
+            while True:
+                # Collect events into batch
+                while len(self._event_batch) < self._event_batch_size:
+                    event = self._quic.next_event()
+                    if event is None:
+                        break
+                    self._event_batch.append(event)
 
-            # Collect events into batch
-            while events_processed < self._event_batch_size:
-                event = self._quic.next_event()
-                if event is None:
+                if not self._event_batch:
                     break
 
-                self._event_batch.append(event)
-                events_processed += 1
-
-            # Process batch if we have events or timeout
-            if self._event_batch and (
-                len(self._event_batch) >= self._event_batch_size
-                or current_time - self._last_event_time > 0.01  # 10ms timeout
-            ):
                 await self._process_event_batch()
                 self._event_batch.clear()
-                self._last_event_time = current_time
                 result = True
         finally:
             self._event_processing_active = False
@@ -999,7 +1025,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 for event in event_list:
                     await self._handle_quic_event(event)
 
-        logger.debug(f"Processed batch of {len(self._event_batch)} events")
+        logger.debug("Processed batch of %d events", len(self._event_batch))
 
     async def _handle_stream_data_batch(
         self, events_list: list[events.StreamDataReceived]
@@ -1012,10 +1038,22 @@ class QUICConnection(IRawConnection, IMuxedConn):
 
         # Process each stream's events
         for stream_id, stream_events in events_by_stream.items():
-            stream = self._get_stream_fast(stream_id)  # Use fast lookup
+            stream = self._streams.get(stream_id)
 
             if not stream:
                 if self._is_incoming_stream(stream_id):
+                    if self._is_late_inbound_fin(
+                        stream_id,
+                        all(
+                            not getattr(e, "data", b"")
+                            and getattr(e, "end_stream", False)
+                            for e in stream_events
+                        ),
+                    ):
+                        logger.debug(
+                            "Ignoring late FIN on closed inbound stream %s", stream_id
+                        )
+                        continue
                     try:
                         stream = await self._create_inbound_stream(stream_id)
                     except QUICStreamLimitError:
@@ -1053,8 +1091,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                     logger.error(
                         f"Unexpected outbound stream {stream_id} in data event "
                         f"(parity={parity}, is_initiator={self._is_initiator}, "
-                        f"quic.is_client={is_client}, streams={len(self._streams)}, "
-                        f"cached={stream_id in self._stream_cache})"
+                        f"quic.is_client={is_client}, streams={len(self._streams)})"
                     )
                     continue
 
@@ -1092,8 +1129,8 @@ class QUICConnection(IRawConnection, IMuxedConn):
                         peer_id=self._remote_peer_id, direction=Direction.INBOUND
                     )
                 except Exception as e:
-                    logger.warning(f"Failed to acquire stream scope: {e}")
-                    raise QUICStreamLimitError(f"Resource limit exceeded: {e}")
+                    logger.warning("Failed to acquire stream scope: %s", e)
+                    raise QUICStreamLimitError("Resource limit exceeded") from e
 
             # Create stream
             stream = QUICStream(
@@ -1105,15 +1142,15 @@ class QUICConnection(IRawConnection, IMuxedConn):
             )
 
             self._streams[stream_id] = stream
-            self._stream_cache[stream_id] = stream  # Add to cache
             self._inbound_stream_count += 1
+            self._record_inbound_stream_id(stream_id)
             self._stats["streams_accepted"] += 1
 
             # Add to accept queue
             self._stream_accept_queue.append(stream)
             self._stream_accept_event.set()
 
-            logger.debug(f"Created inbound stream {stream_id}")
+            logger.debug("Created inbound stream %d", stream_id)
             return stream
 
     async def _process_quic_events(self) -> None:
@@ -1130,33 +1167,14 @@ class QUICConnection(IRawConnection, IMuxedConn):
         until the connection is promoted. This separation prevents double-processing
         of events.
         """
-        logger.debug(f"Handling QUIC event: {type(event).__name__}")
+        logger.debug("Handling QUIC event: %s", type(event).__name__)
 
         try:
-            if isinstance(event, events.ConnectionTerminated):
-                await self._handle_connection_terminated(event)
-            elif isinstance(event, events.HandshakeCompleted):
-                await self._handle_handshake_completed(event)
-            elif isinstance(event, events.StreamDataReceived):
-                await self._handle_stream_data(event)
-            elif isinstance(event, events.StreamReset):
-                await self._handle_stream_reset(event)
-            elif isinstance(event, events.DatagramFrameReceived):
-                await self._handle_datagram_received(event)
-            # Connection ID event handlers - critical for proper packet routing
-            elif isinstance(event, events.ConnectionIdIssued):
-                await self._handle_connection_id_issued(event)
-            elif isinstance(event, events.ConnectionIdRetired):
-                await self._handle_connection_id_retired(event)
-            # Additional event handlers for completeness
-            elif isinstance(event, events.PingAcknowledged):
-                await self._handle_ping_acknowledged(event)
-            elif isinstance(event, events.ProtocolNegotiated):
-                await self._handle_protocol_negotiated(event)
-            elif isinstance(event, events.StopSendingReceived):
-                await self._handle_stop_sending_received(event)
+            handler = self._event_handlers.get(type(event))
+            if handler is not None:
+                await handler(event)
             else:
-                logger.debug(f"Unhandled QUIC event type: {type(event).__name__}")
+                logger.debug("Unhandled QUIC event type: %s", type(event).__name__)
 
         except Exception as e:
             logger.error(f"Error handling QUIC event {type(event).__name__}: {e}")
@@ -1214,13 +1232,13 @@ class QUICConnection(IRawConnection, IMuxedConn):
             sequence: Sequence number for this Connection ID
 
         """
-        notification_start = time.time()
+        notification_start = time.monotonic()
         try:
             if self._listener and self._listener_connection_id:
                 await self._listener._registry.add_connection_id(
                     new_connection_id, self._listener_connection_id, sequence
                 )
-                notification_duration = time.time() - notification_start
+                notification_duration = time.monotonic() - notification_start
                 if notification_duration > self.SLOW_NOTIFICATION_THRESHOLD_SECONDS:
                     logger.debug(
                         f"Slow Connection ID notification: "
@@ -1243,7 +1261,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                     await listener._registry.add_connection_id(
                         new_connection_id, original_connection_id, sequence
                     )
-                    notification_duration = time.time() - notification_start
+                    notification_duration = time.monotonic() - notification_start
                     if notification_duration > 0.01:  # Log slow notifications (>10ms)
                         logger.debug(
                             f"Slow Connection ID notification: "
@@ -1322,7 +1340,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
         )
 
         # Use fast lookup
-        stream = self._get_stream_fast(event.stream_id)
+        stream = self._streams.get(event.stream_id)
         if stream:
             # Handle stop sending on the stream if method exists
             await stream.handle_stop_sending(event.error_code)
@@ -1357,7 +1375,6 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 await stream.close()
 
         self._streams.clear()
-        self._stream_cache.clear()  # Clear cache too
         self._closed = True
         self._closed_event.set()
 
@@ -1373,11 +1390,18 @@ class QUICConnection(IRawConnection, IMuxedConn):
 
         try:
             # Use fast lookup
-            stream = self._get_stream_fast(stream_id)
+            stream = self._streams.get(stream_id)
 
             if not stream:
                 if self._is_incoming_stream(stream_id):
-                    logger.debug(f"Creating new incoming stream {stream_id}")
+                    if self._is_late_inbound_fin(
+                        stream_id, not event.data and event.end_stream
+                    ):
+                        logger.debug(
+                            "Ignoring late FIN on closed inbound stream %s", stream_id
+                        )
+                        return
+                    logger.debug("Creating new incoming stream %d", stream_id)
                     stream = await self._create_inbound_stream(stream_id)
                 else:
                     if not event.data and event.end_stream:
@@ -1400,8 +1424,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
                     logger.error(
                         f"Unexpected outbound stream {stream_id} in data event "
                         f"(parity={parity}, is_initiator={self._is_initiator}, "
-                        f"quic.is_client={is_client}, streams={len(self._streams)}, "
-                        f"cached={stream_id in self._stream_cache})"
+                        f"quic.is_client={is_client}, streams={len(self._streams)})"
                     )
                     return
 
@@ -1414,7 +1437,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
     async def _get_or_create_stream(self, stream_id: int) -> QUICStream:
         """Get existing stream or create new inbound stream."""
         # Use fast lookup
-        stream = self._get_stream_fast(stream_id)
+        stream = self._streams.get(stream_id)
         if stream:
             return stream
 
@@ -1430,6 +1453,31 @@ class QUICConnection(IRawConnection, IMuxedConn):
         # Create new inbound stream
         return await self._create_inbound_stream(stream_id)
 
+    def _is_late_inbound_fin(self, stream_id: int, fin_only: bool) -> bool:
+        """
+        Check whether a FIN-only event targets an inbound stream already closed.
+
+        The peer may half-close a stream after we closed and removed our side
+        of it; that must not resurface as a new inbound stream.
+        """
+        if not fin_only or stream_id in self._unseen_inbound_stream_ids:
+            return False
+        highest = self._highest_inbound_stream_ids.get(stream_id & 0x3)
+        return highest is not None and stream_id <= highest
+
+    def _record_inbound_stream_id(self, stream_id: int) -> None:
+        """Track an inbound stream ID for late FIN detection."""
+        stream_type = stream_id & 0x3
+        highest = self._highest_inbound_stream_ids.get(stream_type, stream_type - 4)
+        if stream_id > highest:
+            # Lower IDs of the same type are implicitly opened by this one
+            # (RFC 9000 section 2.1) but their first frame has not arrived yet.
+            # aioquic enforces the peer's stream limit, which bounds this set.
+            self._unseen_inbound_stream_ids.update(range(highest + 4, stream_id, 4))
+            self._highest_inbound_stream_ids[stream_type] = stream_id
+        else:
+            self._unseen_inbound_stream_ids.discard(stream_id)
+
     def _is_incoming_stream(self, stream_id: int) -> bool:
         """
         Determine if a stream ID represents an incoming stream.
@@ -1451,7 +1499,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
         self._stats["streams_reset"] += 1
 
         # Use fast lookup
-        stream = self._get_stream_fast(stream_id)
+        stream = self._streams.get(stream_id)
         if stream:
             try:
                 await stream.handle_reset(event.error_code)
@@ -1483,6 +1531,20 @@ class QUICConnection(IRawConnection, IMuxedConn):
 
     # Network transmission
 
+    async def _schedule_transmit(self) -> None:
+        """
+        Get pending stream data onto the wire.
+
+        Once the event processing loop is running, the flush is deferred to it
+        so that writes issued in the same scheduling tick are coalesced into a
+        single ``datagrams_to_send()`` pass. Before that (or after close) the
+        data is transmitted inline.
+        """
+        if self._background_tasks_started and not self._closed:
+            self._wake_event_loop()
+        else:
+            await self._transmit()
+
     async def _transmit(self) -> None:
         """Transmit pending QUIC packets using available socket."""
         sock = self._socket
@@ -1494,24 +1556,91 @@ class QUICConnection(IRawConnection, IMuxedConn):
             current_time = time.time()
             datagrams = self._quic.datagrams_to_send(now=current_time)
 
-            # Batch stats updates
-            packet_count = 0
-            total_bytes = 0
-
-            for data, addr in datagrams:
-                await sock.sendto(data, addr)
-                packet_count += 1
-                total_bytes += len(data)
+            if self._gso_enabled and len(datagrams) > 1:
+                await self._send_datagrams_gso(sock, datagrams)
+            else:
+                for data, addr in datagrams:
+                    await sock.sendto(data, addr)
 
             # Update stats in batch
-            if packet_count > 0:
-                self._stats["packets_sent"] += packet_count
-                self._stats["bytes_sent"] += total_bytes
+            if datagrams:
+                self._stats["packets_sent"] += len(datagrams)
+                self._stats["bytes_sent"] += sum(len(data) for data, _ in datagrams)
+                # Sending arms aioquic's loss-detection timer; let the event
+                # loop pick up the new deadline
+                self._wake_event_loop()
 
         except Exception as e:
             logger.error(f"Transmission error: {e}")
             await self._handle_connection_error(e)
 
+    async def _send_datagrams_gso(
+        self, sock: Any, datagrams: list[tuple[bytes, Any]]
+    ) -> None:
+        """
+        Send datagrams with as few syscalls as possible using UDP GSO.
+
+        Consecutive datagrams to the same address are grouped while they all
+        have the size of the first one; a shorter datagram may close a group.
+        Each group goes out in one sendmsg() with a UDP_SEGMENT control message.
+        If the kernel reports GSO as unsupported, it is disabled for this
+        connection and the remaining datagrams are sent one by one; other
+        send errors only fall back to plain sends for the failed group.
+        """
+        i = 0
+        count = len(datagrams)
+        while i < count:
+            first, addr = datagrams[i]
+            segment_size = len(first)
+            group = [first]
+            group_bytes = segment_size
+            i += 1
+            while (
+                i < count
+                and len(group) < _GSO_MAX_SEGMENTS
+                and datagrams[i][1] == addr
+                and len(datagrams[i][0]) <= segment_size
+                and group_bytes + len(datagrams[i][0]) <= _GSO_MAX_BYTES
+            ):
+                data = datagrams[i][0]
+                group.append(data)
+                group_bytes += len(data)
+                i += 1
+                if len(data) < segment_size:
+                    break
+
+            if len(group) == 1:
+                await sock.sendto(first, addr)
+                continue
+
+            try:
+                await sock.sendmsg(
+                    [b"".join(group)],
+                    [
+                        (
+                            socket.IPPROTO_UDP,
+                            _UDP_SEGMENT,
+                            struct.pack("=H", segment_size),
+                        )
+                    ],
+                    0,
+                    addr,
+                )
+            except OSError as e:
+                # Nothing from this group was sent; fall back to plain sends
+                if e.errno not in _GSO_UNSUPPORTED_ERRNOS:
+                    logger.debug("UDP GSO send failed, retrying group: %s", e)
+                    for data in group:
+                        await sock.sendto(data, addr)
+                    continue
+                logger.debug("UDP GSO unavailable, disabling: %s", e)
+                self._gso_enabled = False
+                for data in group:
+                    await sock.sendto(data, addr)
+                for data, addr in datagrams[i:]:
+                    await sock.sendto(data, addr)
+                return
+
     # Additional methods for stream data processing
     async def _process_quic_event(self, event: events.QuicEvent) -> None:
         """Process a single QUIC event."""
@@ -1541,7 +1670,8 @@ class QUICConnection(IRawConnection, IMuxedConn):
             return
 
         self._closed = True
-        logger.debug(f"Closing QUIC connection to {self._remote_peer_id}")
+        self._wake_event_loop()
+        logger.debug("Closing QUIC connection to %s", self._remote_peer_id)
 
         try:
             # Close all streams gracefully, but limit concurrency to prevent
@@ -1589,10 +1719,9 @@ class QUICConnection(IRawConnection, IMuxedConn):
                 self._socket = None
 
             self._streams.clear()
-            self._stream_cache.clear()  # Clear cache
             self._closed_event.set()
 
-            logger.debug(f"QUIC connection to {self._remote_peer_id} closed")
+            logger.debug("QUIC connection to %s closed", self._remote_peer_id)
 
             # Release resource scope if present
             try:
@@ -1713,9 +1842,9 @@ class QUICConnection(IRawConnection, IMuxedConn):
             "max_streams": self.MAX_CONCURRENT_STREAMS,
             "stream_utilization": len(self._streams) / self.MAX_CONCURRENT_STREAMS,
             "stats": self._stats.copy(),
-            "cache_size": len(
-                self._stream_cache
-            ),  # Include cache metrics for monitoring
+            # Deprecated: the separate stream lookup cache was removed; kept
+            # as 0 for one release so monitoring consumers do not break
+            "cache_size": 0,
         }
 
     def get_active_streams(self) -> list[QUICStream]:
@@ -1739,7 +1868,7 @@ class QUICConnection(IRawConnection, IMuxedConn):
 
     async def _cleanup_idle_streams(self) -> None:
         """Clean up idle streams that are no longer needed."""
-        current_time = time.time()
+        current_time = time.monotonic()
         streams_to_cleanup = []
 
         for stream in self._streams.values():
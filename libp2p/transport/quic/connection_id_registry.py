@@ -127,7 +127,7 @@ class ConnectionIDRegistry:
             - If not found: (None, None, False)
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
 
         # Track lock acquisition
         self._lock_stats["acquisitions"] += 1
@@ -138,7 +138,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 # For initial packets, check initial Connection IDs first
@@ -160,8 +160,8 @@ class ConnectionIDRegistry:
                 else:
                     result = (None, None, False)
 
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 # Track max hold time
                 if hold_duration > self._lock_stats["max_hold_time"]:
@@ -217,7 +217,7 @@ class ConnectionIDRegistry:
             Tuple of (connection, original_connection_id) or (None, None) if not found
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
 
         # Track lock acquisition
         self._lock_stats["acquisitions"] += 1
@@ -228,7 +228,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 # Strategy 1: Try address-to-Connection ID lookup (O(1))
@@ -236,8 +236,8 @@ class ConnectionIDRegistry:
                 if original_connection_id:
                     connection = self._connections.get(original_connection_id)
                     if connection:
-                        hold_duration = time.time() - hold_start
-                        total_duration = time.time() - call_start
+                        hold_duration = time.monotonic() - hold_start
+                        total_duration = time.monotonic() - call_start
 
                         # Track max hold time
                         if hold_duration > self._lock_stats["max_hold_time"]:
@@ -270,8 +270,8 @@ class ConnectionIDRegistry:
                         # Address mapping exists but connection not found
                         # Clean up stale mapping
                         del self._addr_to_connection_id[addr]
-                        hold_duration = time.time() - hold_start
-                        total_duration = time.time() - call_start
+                        hold_duration = time.monotonic() - hold_start
+                        total_duration = time.monotonic() - call_start
 
                         # Track max hold time
                         if hold_duration > self._lock_stats["max_hold_time"]:
@@ -311,8 +311,8 @@ class ConnectionIDRegistry:
                     )
                     self._fallback_routing_count += 1
 
-                    hold_duration = time.time() - hold_start
-                    total_duration = time.time() - call_start
+                    hold_duration = time.monotonic() - hold_start
+                    total_duration = time.monotonic() - call_start
 
                     # Track max hold time
                     if hold_duration > self._lock_stats["max_hold_time"]:
@@ -338,8 +338,8 @@ class ConnectionIDRegistry:
                     return (connection, original_connection_id)
 
                 # Not found
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 # Track max hold time
                 if hold_duration > self._lock_stats["max_hold_time"]:
@@ -387,7 +387,7 @@ class ConnectionIDRegistry:
             sequence: Sequence number for this Connection ID (default: 0)
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
         self._lock_stats["acquisitions"] += 1
         was_contended = self._lock_stats["current_holds"] > 0
 
@@ -396,7 +396,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 previous = self._connections.get(connection_id)
@@ -426,8 +426,8 @@ class ConnectionIDRegistry:
                 if connection_id not in self._connection_sequence_counters:
                     self._connection_sequence_counters[connection_id] = sequence
 
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 if hold_duration > self._lock_stats["max_hold_time"]:
                     self._lock_stats["max_hold_time"] = hold_duration
@@ -465,7 +465,7 @@ class ConnectionIDRegistry:
             sequence: Sequence number for this Connection ID (default: 0)
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
         self._lock_stats["acquisitions"] += 1
         was_contended = self._lock_stats["current_holds"] > 0
 
@@ -474,7 +474,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 self._pending[connection_id] = quic_conn
@@ -489,8 +489,8 @@ class ConnectionIDRegistry:
                 if connection_id not in self._connection_sequence_counters:
                     self._connection_sequence_counters[connection_id] = sequence
 
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 if hold_duration > self._lock_stats["max_hold_time"]:
                     self._lock_stats["max_hold_time"] = hold_duration
@@ -527,7 +527,7 @@ class ConnectionIDRegistry:
             sequence: Sequence number for the new Connection ID
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
         self._lock_stats["acquisitions"] += 1
         was_contended = self._lock_stats["current_holds"] > 0
 
@@ -536,7 +536,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 # Get address from existing Connection ID
@@ -580,8 +580,8 @@ class ConnectionIDRegistry:
                         f"{existing_connection_id.hex()[:8]} at address {addr}"
                     )
 
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 if hold_duration > self._lock_stats["max_hold_time"]:
                     self._lock_stats["max_hold_time"] = hold_duration
@@ -615,7 +615,7 @@ class ConnectionIDRegistry:
             The address that was associated with this Connection ID, or None
 
         """
-        call_start = time.time()
+        call_start = time.monotonic()
         self._lock_stats["acquisitions"] += 1
         was_contended = self._lock_stats["current_holds"] > 0
 
@@ -624,7 +624,7 @@ class ConnectionIDRegistry:
             if self._lock_stats["current_holds"] > self._lock_stats["concurrent_holds"]:
                 self._lock_stats["concurrent_holds"] = self._lock_stats["current_holds"]
 
-            hold_start = time.time()
+            hold_start = time.monotonic()
 
             try:
                 # Get connection and sequence before removal
@@ -712,8 +712,8 @@ class ConnectionIDRegistry:
                     # Clean up sequence counter for this Connection ID
                     self._connection_sequence_counters.pop(connection_id, None)
 
-                hold_duration = time.time() - hold_start
-                total_duration = time.time() - call_start
+                hold_duration = time.monotonic() - hold_start
+                total_duration = time.monotonic() - call_start
 
                 if hold_duration > self._lock_stats["max_hold_time"]:
                     self._lock_stats["max_hold_time"] = hold_duration
@@ -91,7 +91,8 @@ class QUICListener(IListener):
 
         # Network components
         self._socket: trio.socket.SocketType | None = None
-        self._bound_addresses: list[Multiaddr] = []
+        # Immutable so get_addrs() can hand it out without copying
+        self._bound_addresses: tuple[Multiaddr, ...] = ()
 
         # Connection ID registry for managing all Connection ID mappings
         self._connection_lock = trio.Lock()
@@ -315,7 +316,7 @@ class QUICListener(IListener):
 
             # Look up connection by Connection ID (check initial Connection IDs for
             # initial packets)
-            find_connection_id_start = time.time()
+            find_connection_id_start = time.monotonic()
             (
                 connection_obj,
                 pending_quic_conn,
@@ -323,7 +324,7 @@ class QUICListener(IListener):
             ) = await self._registry.find_by_connection_id(
                 destination_connection_id, is_initial=is_initial
             )
-            find_connection_id_duration = time.time() - find_connection_id_start
+            find_connection_id_duration = time.monotonic() - find_connection_id_start
             if (
                 find_connection_id_duration > 0.001
             ):  # Log slow find_by_connection_id (>1ms)
@@ -344,12 +345,12 @@ class QUICListener(IListener):
                     # This handles the race condition where packets with new
                     # Connection IDs arrive before ConnectionIdIssued events
                     # are processed
-                    fallback_start = time.time()
+                    fallback_start = time.monotonic()
                     (
                         connection_obj,
                         original_connection_id,
                     ) = await self._registry.find_by_address(addr)
-                    fallback_duration = time.time() - fallback_start
+                    fallback_duration = time.monotonic() - fallback_start
                     if fallback_duration > 0.01:  # Log slow fallback routing (>10ms)
                         logger.debug(
                             f"Slow fallback routing: {fallback_duration * 1000:.2f}ms "
@@ -706,7 +707,8 @@ class QUICListener(IListener):
             # Feed data to the connection's QUIC instance
             connection._quic.receive_datagram(data, addr, now=time.time())
             # NOTE: Established connections process events and transmit in their own
-            # event loop. Avoid double-consuming `next_event()` here.
+            # event loop. Avoid double-consuming `next_event()` here; just wake it.
+            connection._wake_event_loop()
 
         except Exception as e:
             logger.error(
@@ -776,11 +778,11 @@ class QUICListener(IListener):
         try:
             # Check if connection is already promoted - if so, don't process events here
             # as the connection's event loop will handle them
-            find_connection_id_start = time.time()
+            find_connection_id_start = time.monotonic()
             connection_obj, _, _ = await self._registry.find_by_connection_id(
                 destination_connection_id
             )
-            find_connection_id_duration = time.time() - find_connection_id_start
+            find_connection_id_duration = time.monotonic() - find_connection_id_start
             if (
                 find_connection_id_duration > 0.001
             ):  # Log slow find_by_connection_id (>1ms)
@@ -792,14 +794,14 @@ class QUICListener(IListener):
             if connection_obj:
                 return
 
-            batch_start = time.time()
+            batch_start = time.monotonic()
             event_count = 0
             while True:
                 event = quic_conn.next_event()
                 if event is None:
                     break
 
-                event_start = time.time()
+                event_start = time.monotonic()
                 event_count += 1
 
                 if isinstance(event, events.ConnectionTerminated):
@@ -933,7 +935,7 @@ class QUICListener(IListener):
                         await self._registry.remove_connection_id(retired_connection_id)
 
                 # Log slow event processing
-                event_duration = time.time() - event_start
+                event_duration = time.monotonic() - event_start
                 if event_duration > 0.01:  # Log slow events (>10ms)
                     logger.debug(
                         f"Slow event processing: {type(event).__name__} took "
@@ -942,7 +944,7 @@ class QUICListener(IListener):
                     )
 
             # Log batch processing time
-            batch_duration = time.time() - batch_start
+            batch_duration = time.monotonic() - batch_start
             if batch_duration > 0.01 and event_count > 0:  # Log slow batches
                 logger.debug(
                     f"Processed {event_count} events in {batch_duration * 1000:.2f}ms "
@@ -982,7 +984,7 @@ class QUICListener(IListener):
         destination_connection_id: bytes,
     ) -> None:
         """Promote pending connection - avoid duplicate creation."""
-        promotion_start = time.time()
+        promotion_start = time.monotonic()
 
         quic_key = id(quic_conn)
         pending_cid = self._pending_cid_by_quic_id.get(
@@ -1101,7 +1103,7 @@ class QUICListener(IListener):
                 )
 
                 # Log promotion duration
-                promotion_duration = time.time() - promotion_start
+                promotion_duration = time.monotonic() - promotion_start
                 if promotion_duration > 0.01:  # Log slow promotions (>10ms)
                     logger.debug(
                         f"Slow connection promotion: {promotion_duration * 1000:.2f}ms "
@@ -1231,7 +1233,7 @@ class QUICListener(IListener):
                 bound_maddr = create_quic_multiaddr(
                     bound_host, bound_port, quic_version
                 )
-                self._bound_addresses = [bound_maddr]
+                self._bound_addresses = (bound_maddr,)
                 self._listening = True
 
                 self._nursery.start_soon(self._handle_incoming_packets)
@@ -1263,7 +1265,7 @@ class QUICListener(IListener):
                         bound_maddr = create_quic_multiaddr(
                             bound_host, bound_port, quic_version
                         )
-                        self._bound_addresses = [bound_maddr]
+                        self._bound_addresses = (bound_maddr,)
                         self._listening = True
 
                         inner_nursery.start_soon(self._handle_incoming_packets)
@@ -1378,7 +1380,7 @@ class QUICListener(IListener):
                 self._socket.close()
                 self._socket = None
 
-            self._bound_addresses.clear()
+            self._bound_addresses = ()
 
             # If we spawned our own internal nursery (fallback path),
             # cancel it and wait for the background system task to finish.
@@ -1421,7 +1423,7 @@ class QUICListener(IListener):
 
     def get_addresses(self) -> list[Multiaddr]:
         """Get the bound addresses."""
-        return self._bound_addresses.copy()
+        return list(self._bound_addresses)
 
     async def _handle_new_established_connection(
         self, connection: QUICConnection
@@ -1445,7 +1447,7 @@ class QUICListener(IListener):
             await connection.close()
 
     def get_addrs(self) -> tuple[Multiaddr, ...]:
-        return tuple(self.get_addresses())
+        return self._bound_addresses
 
     def is_listening(self) -> bool:
         """
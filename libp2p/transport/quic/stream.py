@@ -60,8 +60,17 @@ class StreamDirection(Enum):
 class StreamTimeline:
     """Track stream lifecycle events for debugging and monitoring."""
 
+    __slots__ = (
+        "created_at",
+        "opened_at",
+        "first_data_at",
+        "closed_at",
+        "reset_at",
+        "error_code",
+    )
+
     def __init__(self) -> None:
-        self.created_at = time.time()
+        self.created_at = time.monotonic()
         self.opened_at: float | None = None
         self.first_data_at: float | None = None
         self.closed_at: float | None = None
@@ -69,17 +78,17 @@ class StreamTimeline:
         self.error_code: int | None = None
 
     def record_open(self) -> None:
-        self.opened_at = time.time()
+        self.opened_at = time.monotonic()
 
     def record_first_data(self) -> None:
         if self.first_data_at is None:
-            self.first_data_at = time.time()
+            self.first_data_at = time.monotonic()
 
     def record_close(self) -> None:
-        self.closed_at = time.time()
+        self.closed_at = time.monotonic()
 
     def record_reset(self, error_code: int) -> None:
-        self.reset_at = time.time()
+        self.reset_at = time.monotonic()
         self.error_code = error_code
 
 
@@ -95,6 +104,33 @@ class QUICStream(IMuxedStream):
     - Implements proper stream lifecycle management
     """
 
+    # One instance per QUIC stream; slots keep them small and attribute
+    # access on the read/write path fast
+    __slots__ = (
+        "_connection",
+        "_stream_id",
+        "_direction",
+        "_resource_scope",
+        "_protocol",
+        "_metadata",
+        "_remote_addr",
+        "_state",
+        "_state_lock",
+        "_receive_buffer",
+        "_receive_event",
+        "_backpressure_event",
+        "_write_closed",
+        "_read_closed",
+        "_close_event",
+        "_reset_error_code",
+        "_timeline",
+        "_memory_reserved",
+        "READ_TIMEOUT",
+        "WRITE_TIMEOUT",
+        "FLOW_CONTROL_WINDOW_SIZE",
+        "MAX_RECEIVE_BUFFER_SIZE",
+    )
+
     def __init__(
         self,
         connection: "QUICConnection",
@@ -128,9 +164,10 @@ class QUICStream(IMuxedStream):
         self._state = StreamState.OPEN
         self._state_lock = trio.Lock()
 
-        # Flow control and buffering
+        # Flow control and buffering. The receive buffer is only touched
+        # between checkpoints, so trio's cooperative scheduling already
+        # serializes access; readers are woken through _receive_event.
         self._receive_buffer = bytearray()
-        self._receive_buffer_lock = trio.Lock()
         self._receive_event = trio.Event()
         self._backpressure_event = trio.Event()
         self._backpressure_event.set()  # Initially no backpressure
@@ -162,8 +199,10 @@ class QUICStream(IMuxedStream):
             self._reserve_memory(self.FLOW_CONTROL_WINDOW_SIZE)
 
         logger.debug(
-            f"Created QUIC stream {stream_id} "
-            f"({direction.value}, connection: {connection.remote_peer_id()})"
+            "Created QUIC stream %d (%s, connection: %s)",
+            stream_id,
+            direction.value,
+            connection.remote_peer_id(),
         )
 
     # Properties for libp2p interface compliance
@@ -178,7 +217,7 @@ class QUICStream(IMuxedStream):
         """Set the protocol identifier for this stream."""
         self._protocol = protocol_id
         self._metadata["protocol"] = protocol_id
-        logger.debug(f"Stream {self.stream_id} protocol set to: {protocol_id}")
+        logger.debug("Stream %d protocol set to: %s", self._stream_id, protocol_id)
 
     @property
     def stream_id(self) -> str:
@@ -232,11 +271,10 @@ class QUICStream(IMuxedStream):
 
             if self._read_closed:
                 # Return any remaining buffered data, then EOF
-                async with self._receive_buffer_lock:
-                    if self._receive_buffer:
-                        data = self._extract_data_from_buffer(n)
-                        self._timeline.record_first_data()
-                        return data
+                if self._receive_buffer:
+                    data = self._extract_data_from_buffer(n)
+                    self._timeline.record_first_data()
+                    return data
                 return b""
 
         # Wait for data with timeout
@@ -244,21 +282,18 @@ class QUICStream(IMuxedStream):
         try:
             with trio.move_on_after(timeout) as cancel_scope:
                 while True:
-                    async with self._receive_buffer_lock:
-                        if self._receive_buffer:
-                            data = self._extract_data_from_buffer(n)
-                            self._timeline.record_first_data()
-                            return data
-
-                        # Check if stream was reset (unblocking read loop)
-                        if self._state == StreamState.RESET:
-                            raise QUICStreamResetError(
-                                f"Stream {self.stream_id} was reset"
-                            )
-
-                        # Check if stream was closed while waiting
-                        if self._read_closed:
-                            return b""
+                    if self._receive_buffer:
+                        data = self._extract_data_from_buffer(n)
+                        self._timeline.record_first_data()
+                        return data
+
+                    # Check if stream was reset (unblocking read loop)
+                    if self._state == StreamState.RESET:
+                        raise QUICStreamResetError(f"Stream {self.stream_id} was reset")
+
+                    # Check if stream was closed while waiting
+                    if self._read_closed:
+                        return b""
 
                     # Wait for more data
                     await self._receive_event.wait()
@@ -272,7 +307,7 @@ class QUICStream(IMuxedStream):
             # Stream was reset while reading
             raise
         except Exception as e:
-            logger.error(f"Error reading from stream {self.stream_id}: {e}")
+            logger.error("Error reading from stream %d: %s", self._stream_id, e)
             await self._handle_stream_error(e)
             raise
 
@@ -305,24 +340,25 @@ class QUICStream(IMuxedStream):
             # Handle flow control backpressure
             await self._backpressure_event.wait()
 
-            # Send data through QUIC connection
+            # Queue data on the QUIC connection; the connection coalesces
+            # the actual flush with other pending writes
             self._connection._quic.send_stream_data(self._stream_id, data)
-            await self._connection._transmit()
+            await self._connection._schedule_transmit()
 
             self._timeline.record_first_data()
-            logger.debug(f"Wrote {len(data)} bytes to stream {self.stream_id}")
+            logger.debug("Wrote %d bytes to stream %d", len(data), self._stream_id)
 
         except Exception as e:
-            logger.error(f"Error writing to stream {self.stream_id}: {e}")
+            logger.error("Error writing to stream %d: %s", self._stream_id, e)
             # Convert QUIC-specific errors using isinstance checks
             if QuicConnectionError is not None and isinstance(e, QuicConnectionError):
                 error_code = getattr(e, "error_code", None)
                 # QUIC flow control error code is 0x03
                 if error_code == 0x03:
                     raise QUICStreamBackpressureError(
-                        f"Flow control limit reached: {e}",
+                        "Flow control limit reached",
                         error_code=error_code,
-                    )
+                    ) from e
             await self._handle_stream_error(e)
             raise
 
@@ -337,7 +373,7 @@ class QUICStream(IMuxedStream):
             if self._state in (StreamState.CLOSED, StreamState.RESET):
                 return
 
-            logger.debug(f"Closing stream {self.stream_id}")
+            logger.debug("Closing stream %d", self._stream_id)
 
         # Close both sides
         if not self._write_closed:
@@ -353,7 +389,7 @@ class QUICStream(IMuxedStream):
         self._timeline.record_close()
         self._close_event.set()
 
-        logger.debug(f"Stream {self.stream_id} closed")
+        logger.debug("Stream %d closed", self._stream_id)
 
     async def close_write(self) -> None:
         """Close the write side of the stream."""
@@ -375,7 +411,7 @@ class QUICStream(IMuxedStream):
                 else:
                     self._state = StreamState.WRITE_CLOSED
 
-            logger.debug(f"Stream {self.stream_id} write side closed")
+            logger.debug("Stream %d write side closed", self._stream_id)
 
         except Exception as e:
             # Classify the exception using isinstance instead of string matching.
@@ -398,7 +434,7 @@ class QUICStream(IMuxedStream):
                     else:
                         self._state = StreamState.WRITE_CLOSED
                 logger.debug(
-                    f"Ignoring close_write error on stream {self.stream_id}: {e}"
+                    "Ignoring close_write error on stream %d: %s", self._stream_id, e
                 )
                 return
             logger.error(f"Error closing write side of stream {self.stream_id}: {e}")
@@ -420,7 +456,7 @@ class QUICStream(IMuxedStream):
             # Wake up any pending reads
             self._receive_event.set()
 
-            logger.debug(f"Stream {self.stream_id} read side closed")
+            logger.debug("Stream %d read side closed", self._stream_id)
 
         except Exception as e:
             logger.error(f"Error closing read side of stream {self.stream_id}: {e}")
@@ -438,7 +474,7 @@ class QUICStream(IMuxedStream):
                 return
 
             logger.debug(
-                f"Resetting stream {self.stream_id} with error code {error_code}"
+                "Resetting stream %d with error code %d", self._stream_id, error_code
             )
 
             self._state = StreamState.RESET
@@ -453,7 +489,9 @@ class QUICStream(IMuxedStream):
             # ValueError for unknown peer-initiated streams is expected
             # during shutdown races; downgrade to debug.
             if isinstance(e, ValueError) and "peer-initiated" in str(e):
-                logger.debug(f"Ignoring reset error on stream {self.stream_id}: {e}")
+                logger.debug(
+                    "Ignoring reset error on stream %d: %s", self._stream_id, e
+                )
             else:
                 logger.error(f"Error sending reset for stream {self.stream_id}: {e}")
         finally:
@@ -540,21 +578,20 @@ class QUICStream(IMuxedStream):
             return
 
         if data:
-            async with self._receive_buffer_lock:
-                if len(self._receive_buffer) + len(data) > self.MAX_RECEIVE_BUFFER_SIZE:
-                    logger.warning(
-                        f"Stream {self.stream_id} receive buffer overflow, "
-                        f"dropping {len(data)} bytes"
-                    )
-                    return
+            if len(self._receive_buffer) + len(data) > self.MAX_RECEIVE_BUFFER_SIZE:
+                logger.warning(
+                    f"Stream {self.stream_id} receive buffer overflow, "
+                    f"dropping {len(data)} bytes"
+                )
+                return
 
-                self._receive_buffer.extend(data)
-                self._timeline.record_first_data()
+            self._receive_buffer.extend(data)
+            self._timeline.record_first_data()
 
             # Notify waiting readers
             self._receive_event.set()
 
-            logger.debug(f"Stream {self.stream_id} received {len(data)} bytes")
+            logger.debug("Stream %d received %d bytes", self._stream_id, len(data))
 
         if end_stream:
             self._read_closed = True
@@ -567,7 +604,7 @@ class QUICStream(IMuxedStream):
             # Wake up readers to process remaining data and EOF
             self._receive_event.set()
 
-            logger.debug(f"Stream {self.stream_id} received FIN")
+            logger.debug("Stream %d received FIN", self._stream_id)
 
     async def handle_stop_sending(self, error_code: int) -> None:
         """
@@ -581,7 +618,9 @@ class QUICStream(IMuxedStream):
 
         """
         logger.debug(
-            f"Stream {self.stream_id} handling STOP_SENDING (error_code={error_code})"
+            "Stream %d handling STOP_SENDING (error_code=%d)",
+            self._stream_id,
+            error_code,
         )
 
         self._write_closed = True
@@ -602,7 +641,7 @@ class QUICStream(IMuxedStream):
         try:
             self._connection._quic.reset_stream(int(self.stream_id), error_code)
             await self._connection._transmit()
-            logger.debug(f"Sent RESET_STREAM for stream {self.stream_id}")
+            logger.debug("Sent RESET_STREAM for stream %d", self._stream_id)
         except Exception as e:
             logger.warning(
                 f"Could not send RESET_STREAM for stream {self.stream_id}: {e}"
@@ -617,7 +656,7 @@ class QUICStream(IMuxedStream):
 
         """
         logger.debug(
-            f"Stream {self.stream_id} reset by peer with error code {error_code}"
+            "Stream %d reset by peer with error code %d", self._stream_id, error_code
         )
 
         async with self._state_lock:
@@ -649,7 +688,7 @@ class QUICStream(IMuxedStream):
             )
         else:
             self._backpressure_event = trio.Event()  # Reset to blocking state
-            logger.debug(f"Stream {self.stream_id} flow control window exhausted")
+            logger.debug("Stream %d flow control window exhausted", self._stream_id)
 
     def _extract_data_from_buffer(self, n: int) -> bytes:
         """Extract data from receive buffer with specified limit."""
@@ -658,15 +697,20 @@ class QUICStream(IMuxedStream):
             data = bytes(self._receive_buffer)
             self._receive_buffer.clear()
         else:
-            # Read up to n bytes
+            # Read up to n bytes, consuming them in place rather than
+            # reallocating the remainder of the buffer
             data = bytes(self._receive_buffer[:n])
-            self._receive_buffer = self._receive_buffer[n:]
+            del self._receive_buffer[:n]
 
         return data
 
     async def _handle_stream_error(self, error: Exception) -> None:
-        """Handle errors by resetting the stream."""
-        logger.error(f"Stream {self.stream_id} error: {error}")
+        """
+        Handle errors by resetting the stream.
+
+        Callers log the error with their own context before calling this,
+        so it is not logged a second time here.
+        """
         await self.reset(error_code=1)  # Generic error code
 
     def _reserve_memory(self, size: int) -> None:
@@ -698,8 +742,7 @@ class QUICStream(IMuxedStream):
             self._release_memory(self._memory_reserved)
 
         # Clear receive buffer
-        async with self._receive_buffer_lock:
-            self._receive_buffer.clear()
+        self._receive_buffer.clear()
 
         # Release resource scope if present
         if self._resource_scope and hasattr(self._resource_scope, "done"):
@@ -712,7 +755,7 @@ class QUICStream(IMuxedStream):
         # Remove from connection's stream registry
         self._connection._remove_stream(self._stream_id)
 
-        logger.debug(f"Stream {self.stream_id} resources cleaned up")
+        logger.debug("Stream %d resources cleaned up", self._stream_id)
 
     # Abstact implementations
 
@@ -140,6 +140,9 @@ class QUICTransport(ITransport):
                 verify_mode=self._config.verify_mode,
                 max_datagram_frame_size=self._config.max_datagram_size,
                 idle_timeout=self._config.idle_timeout,
+                congestion_control_algorithm=(
+                    self._config.congestion_control_algorithm
+                ),
             )
 
             # Base client configuration
@@ -149,6 +152,9 @@ class QUICTransport(ITransport):
                 verify_mode=self._config.verify_mode,
                 max_datagram_frame_size=self._config.max_datagram_size,
                 idle_timeout=self._config.idle_timeout,
+                congestion_control_algorithm=(
+                    self._config.congestion_control_algorithm
+                ),
             )
 
             # Apply TLS configuration
@@ -268,7 +274,11 @@ class QUICTransport(ITransport):
 
             # Get appropriate QUIC client configuration
             config_key = TProtocol(f"{quic_version}_client")
-            logger.debug("config_key", config_key, self._quic_configs.keys())
+            logger.debug(
+                "Using QUIC config %s (available: %s)",
+                config_key,
+                list(self._quic_configs),
+            )
             config = self._quic_configs.get(config_key)
             if not config:
                 raise QUICDialError(f"Unsupported QUIC version: {quic_version}")
@@ -286,7 +296,10 @@ class QUICTransport(ITransport):
 
             # Debug log to verify certificate is present
             logger.info(
-                f"Dialing QUIC connection to {host}:{port} (version: {{quic_version}})"
+                "Dialing QUIC connection to %s:%d (version: %s)",
+                host,
+                port,
+                quic_version,
             )
 
             logger.debug("Starting QUIC Connection")
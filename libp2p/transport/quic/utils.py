@@ -313,6 +313,7 @@ def create_server_config_from_base(
             "verify_mode",
             "max_datagram_frame_size",
             "idle_timeout",
+            "congestion_control_algorithm",
             "max_concurrent_streams",
             "supported_versions",
             "max_data",
@@ -403,6 +404,7 @@ def create_client_config_from_base(
             "verify_mode",
             "max_datagram_frame_size",
             "idle_timeout",
+            "congestion_control_algorithm",
             "max_concurrent_streams",
             "supported_versions",
             "max_data",
@@ -4,10 +4,12 @@ Tests all new features including advanced stream management, resource management
 error handling, and concurrent operations.
 """
 
+import errno
+import struct
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from aioquic.quic.events import ConnectionIdIssued
+from aioquic.quic.events import ConnectionIdIssued, StreamDataReceived
 from multiaddr.multiaddr import Multiaddr
 import trio
 
@@ -341,7 +343,144 @@ class TestQUICConnection:
         quic_connection._remove_stream(int(stream.stream_id))
 
         assert int(stream.stream_id) not in quic_connection._streams
-        # Note: Count updates is async, so we can't test it directly here
+        assert quic_connection._outbound_stream_count == 0
+        assert quic_connection._stats["streams_closed"] == 1
+
+    # Late FIN handling tests
+
+    @pytest.mark.trio
+    async def test_late_fin_on_removed_inbound_stream_ignored(
+        self, quic_connection: QUICConnection
+    ) -> None:
+        """Test a FIN for a closed inbound stream does not create a new stream."""
+        # Odd IDs are server-initiated, i.e. inbound for this client connection
+        await quic_connection._handle_stream_data(
+            StreamDataReceived(data=b"hello", end_stream=False, stream_id=1)
+        )
+        assert len(quic_connection._stream_accept_queue) == 1
+        quic_connection._stream_accept_queue.clear()
+        quic_connection._remove_stream(1)
+
+        await quic_connection._handle_stream_data(
+            StreamDataReceived(data=b"", end_stream=True, stream_id=1)
+        )
+
+        assert 1 not in quic_connection._streams
+        assert len(quic_connection._stream_accept_queue) == 0
+
+    @pytest.mark.trio
+    async def test_fin_only_new_inbound_streams_accepted(
+        self, quic_connection: QUICConnection
+    ) -> None:
+        """Test FIN-only first frames of unseen inbound streams are accepted."""
+        await quic_connection._handle_stream_data(
+            StreamDataReceived(data=b"hello", end_stream=False, stream_id=9)
+        )
+        quic_connection._stream_accept_queue.clear()
+
+        # Lower bidirectional ID whose first frame arrives late
+        await quic_connection._handle_stream_data(
+            StreamDataReceived(data=b"", end_stream=True, stream_id=5)
+        )
+        # Unidirectional ID below the bidirectional high-water mark
+        await quic_connection._handle_stream_data(
+            StreamDataReceived(data=b"", end_stream=True, stream_id=3)
+        )
+
+        accepted = [int(s.stream_id) for s in quic_connection._stream_accept_queue]
+        assert accepted == [5, 3]
+
+    # Transmission tests
+
+    @pytest.mark.trio
+    async def test_schedule_transmit_inline_before_background_tasks(
+        self, quic_connection: QUICConnection
+    ) -> None:
+        """Test writes are flushed inline until the event loop is running."""
+        with patch.object(
+            quic_connection, "_transmit", new_callable=AsyncMock
+        ) as mock_transmit:
+            await quic_connection._schedule_transmit()
+
+            mock_transmit.assert_awaited_once()
+            assert not quic_connection._wakeup_event.is_set()
+
+    @pytest.mark.trio
+    async def test_schedule_transmit_wakes_event_loop(
+        self, quic_connection: QUICConnection
+    ) -> None:
+        """Test writes are deferred to the event loop once it is running."""
+        quic_connection._background_tasks_started = True
+
+        with patch.object(
+            quic_connection, "_transmit", new_callable=AsyncMock
+        ) as mock_transmit:
+            await quic_connection._schedule_transmit()
+
+            mock_transmit.assert_not_awaited()
+            assert quic_connection._wakeup_event.is_set()
+
+    @pytest.mark.trio
+    async def test_transmit_groups_datagrams_for_gso(
+        self, quic_connection: QUICConnection, mock_quic_connection: Mock
+    ) -> None:
+        """Test equally sized datagrams are sent as one segmented write."""
+        addr = ("127.0.0.1", 4001)
+        datagrams = [(b"a" * 1200, addr), (b"b" * 1200, addr), (b"c" * 300, addr)]
+        mock_quic_connection.datagrams_to_send.return_value = datagrams
+        sock = Mock()
+        sock.sendmsg = AsyncMock()
+        sock.sendto = AsyncMock()
+        quic_connection._socket = sock
+        quic_connection._gso_enabled = True
+
+        await quic_connection._transmit()
+
+        sock.sendmsg.assert_called_once()
+        buffers, ancdata, _, dest = sock.sendmsg.call_args.args
+        assert buffers == [b"a" * 1200 + b"b" * 1200 + b"c" * 300]
+        assert ancdata[0][2] == struct.pack("=H", 1200)
+        assert dest == addr
+        sock.sendto.assert_not_called()
+        assert quic_connection._stats["packets_sent"] == 3
+
+    @pytest.mark.trio
+    async def test_transmit_falls_back_when_gso_rejected(
+        self, quic_connection: QUICConnection, mock_quic_connection: Mock
+    ) -> None:
+        """Test GSO is disabled and datagrams resent when the kernel refuses it."""
+        addr = ("127.0.0.1", 4001)
+        datagrams = [(b"a" * 1200, addr), (b"b" * 1200, addr)]
+        mock_quic_connection.datagrams_to_send.return_value = datagrams
+        sock = Mock()
+        sock.sendmsg = AsyncMock(side_effect=OSError(errno.EIO, "EIO"))
+        sock.sendto = AsyncMock()
+        quic_connection._socket = sock
+        quic_connection._gso_enabled = True
+
+        await quic_connection._transmit()
+
+        assert quic_connection._gso_enabled is False
+        assert sock.sendto.await_count == 2
+
+    @pytest.mark.trio
+    async def test_transmit_keeps_gso_on_transient_error(
+        self, quic_connection: QUICConnection, mock_quic_connection: Mock
+    ) -> None:
+        """Test a transient send error only falls back for the failed group."""
+        addr = ("127.0.0.1", 4001)
+        datagrams = [(b"a" * 1200, addr), (b"b" * 1200, addr)]
+        mock_quic_connection.datagrams_to_send.return_value = datagrams
+        sock = Mock()
+        sock.sendmsg = AsyncMock(side_effect=OSError(errno.ENOBUFS, "ENOBUFS"))
+        sock.sendto = AsyncMock()
+        quic_connection._socket = sock
+        quic_connection._gso_enabled = True
+
+        await quic_connection._transmit()
+
+        assert quic_connection._gso_enabled is True
+        assert sock.sendto.await_count == 2
 
     # Error handling tests
 
@@ -46,6 +46,20 @@ class TestQUICTransport:
         assert not transport._closed
         assert len(transport._quic_configs) >= 1
 
+    def test_congestion_control_algorithm_applied(self, private_key):
+        """Test the configured congestion controller reaches every QUIC config."""
+        config = QUICTransportConfig(congestion_control_algorithm="cubic")
+        transport = QUICTransport(private_key, config)
+
+        assert transport._quic_configs
+        for quic_config in transport._quic_configs.values():
+            assert quic_config.congestion_control_algorithm == "cubic"
+
+    def test_invalid_congestion_control_algorithm(self):
+        """Test unknown congestion controllers are rejected."""
+        with pytest.raises(ValueError, match="congestion_control_algorithm"):
+            QUICTransportConfig(congestion_control_algorithm="bbr")
+
     def test_quic_transport_forwards_enable_autotls_to_security_factory(
         self, private_key
     ):